@@ -106,15 +106,28 @@ TIPS:
 import math
 import random
 
+# Bind the math functions we call every frame to module-level names
+# (skips the 'math.' attribute lookup on each call).
+_deg, _atan2, _sqrt, _hypot = math.degrees, math.atan2, math.sqrt, math.hypot
+_DEG_TO_RAD = 0.017453292519943295  # math.pi / 180
+_DANGER_RADIUS = 50
+
 
 def distance(x1, y1, x2, y2):
     """Calculate distance between two points."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return _hypot(x2 - x1, y2 - y1)
+
+
+def _dist_sq(x1, y1, x2, y2):
+    """Squared distance between two points (no sqrt, use it to compare distances)."""
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
 
 
 def angle_to(x1, y1, x2, y2):
     """Calculate angle from point (x1, y1) to point (x2, y2) in degrees. Returns -180° to +180°"""
-    return math.degrees(math.atan2(y2 - y1, x2 - x1))
+    return _deg(_atan2(y2 - y1, x2 - x1))
 
 
 def find_nearest(my_x, my_y, targets):
@@ -124,33 +137,44 @@ def find_nearest(my_x, my_y, targets):
     Returns (target, distance) or (None, float('inf')) if list is empty.
     """
     nearest = None
-    min_dist = float('inf')
+    min_dist_sq = float('inf')
     
     for target in targets:
-        dist = distance(my_x, my_y, target["x"], target["y"])
-        if dist < min_dist:
-            min_dist = dist
+        # Skip targets that are further away sideways than the best one so far
+        dx = target["x"] - my_x
+        if dx * dx >= min_dist_sq:
+            continue
+        dist_sq = _dist_sq(my_x, my_y, target["x"], target["y"])
+        if dist_sq < min_dist_sq:
+            min_dist_sq = dist_sq
             nearest = target
     
-    return nearest, min_dist
+    return nearest, _sqrt(min_dist_sq)
 
 
-def will_bullet_hit_me(my_x, my_y, bullet, danger_radius=50):
+def will_bullet_hit_me(my_x, my_y, bullet, danger_radius=_DANGER_RADIUS):
     """
     Predict if a bullet will come close to your position.
     Returns True if bullet is dangerous.
     """
+    reach = danger_radius * 2
+    
+    # Quick reject: bullet is outside the square around us, so it's too far anyway
+    if abs(bullet["x"] - my_x) > reach or abs(bullet["y"] - my_y) > reach:
+        return False
+    
     # Future position of bullet
     # Look ~10 frames ahead to estimate bullet direction (heuristic, not exact)
     future_x = bullet["x"] + bullet["vx"] * 10
     future_y = bullet["y"] + bullet["vy"] * 10
     
     # Check if bullet path intersects with our position
-    dist_now = distance(my_x, my_y, bullet["x"], bullet["y"])
-    dist_future = distance(my_x, my_y, future_x, future_y)
+    # (squared distances compare the same way as real ones, without the sqrt)
+    dist_now_sq = _dist_sq(my_x, my_y, bullet["x"], bullet["y"])
+    dist_future_sq = _dist_sq(my_x, my_y, future_x, future_y)
     
     # Bullet is approaching if it gets closer
-    return dist_future < dist_now and dist_now < danger_radius * 2
+    return dist_future_sq < dist_now_sq and dist_now_sq < reach * reach
 
 # =============================================================================
 # YOUR CODE STARTS HERE!
@@ -186,11 +210,12 @@ def update(context):
 
     sensors = context["sensors"]
     my_angle = me["angle"]
+    my_angle_rad = my_angle * _DEG_TO_RAD  # in radians, ready for math.cos/math.sin
     
     # EMERGENCY REVERSE: If face-planted into wall (< 10 pixels)
     if sensors["front"] < 10:
         # Full reverse! Move opposite to facing direction
-        reverse_angle = math.radians(my_angle + 180)
+        reverse_angle = my_angle_rad + math.pi
         return ("MOVE", (math.cos(reverse_angle), math.sin(reverse_angle)))
     
     # STANDARD AVOIDANCE: Wall approaching (< 50 pixels)
@@ -198,22 +223,22 @@ def update(context):
         # Turn toward open space
         if sensors["left"] > sensors["right"]:
             # More space on left - turn left (perpendicular to facing)
-            turn_angle = math.radians(my_angle - 90)
+            turn_angle = my_angle_rad - math.pi * 0.5
         else:
             # More space on right - turn right
-            turn_angle = math.radians(my_angle + 90)
+            turn_angle = my_angle_rad + math.pi * 0.5
         dx = math.cos(turn_angle)
         dy = math.sin(turn_angle)
         return ("MOVE", (dx, dy))
     
     elif sensors["left"] < 30:
         # Wall on left - nudge right
-        turn_angle = math.radians(my_angle + 45)
+        turn_angle = my_angle_rad + math.pi * 0.25
         return ("MOVE", (math.cos(turn_angle), math.sin(turn_angle)))
     
     elif sensors["right"] < 30:
         # Wall on right - nudge left
-        turn_angle = math.radians(my_angle - 45)
+        turn_angle = my_angle_rad - math.pi * 0.25
         return ("MOVE", (math.cos(turn_angle), math.sin(turn_angle)))   
     
     # note: If none of the conditions above trigger,